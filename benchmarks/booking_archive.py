@@ -0,0 +1,139 @@
+"""
+Benchmark GET /api/bookings/ and the booking table size before and after
+moving historical bookings out with `manage.py archive_bookings`.
+
+Seeds a throwaway SQLite file with `--rows` past bookings spread over
+`--users` users plus a few upcoming bookings each:
+
+    python benchmarks/booking_archive.py [--rows 10000000] [--users 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "littlelemon.test_settings")
+
+from django.conf import settings  # noqa: E402
+
+DB_FILE = Path(tempfile.mkdtemp(prefix="booking-archive-")) / "bench.sqlite3"
+settings.DATABASES["default"]["NAME"] = str(DB_FILE)
+settings.ALLOWED_HOSTS = ["testserver"]
+settings.MIDDLEWARE = [m for m in settings.MIDDLEWARE if "QueryCount" not in m]
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+UPCOMING_PER_USER = 5
+
+
+def seed(rows, users):
+    User.objects.bulk_create(User(username=f"user{i}") for i in range(users))
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(id) FROM auth_user")
+        first_user = cursor.fetchone()[0]
+        # Past bookings, 100 days to ~10 years ago, built inside SQLite.
+        cursor.execute(
+            """
+            INSERT INTO reastaurant_booking
+                (user_id, name, no_of_guests, booking_date, booking_time)
+            WITH RECURSIVE seq(n) AS (
+                SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s
+            )
+            SELECT %s + n %% %s, 'Guest ' || n, 2,
+                   date('now', '-' || (100 + n %% 3500) || ' days'), '19:00:00'
+            FROM seq
+            """,
+            [rows, first_user, users],
+        )
+        cursor.execute(
+            """
+            INSERT INTO reastaurant_booking
+                (user_id, name, no_of_guests, booking_date, booking_time)
+            WITH RECURSIVE seq(n) AS (
+                SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s
+            )
+            SELECT %s + n %% %s, 'Upcoming ' || n, 4,
+                   date('now', '+' || (1 + n %% 60) || ' days'), '20:00:00'
+            FROM seq
+            """,
+            [UPCOMING_PER_USER * users, first_user, users],
+        )
+    return User.objects.get(id=first_user)
+
+
+def table_size(table):
+    """Bytes used by a table and its indexes, from SQLite's dbstat view"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name = %s OR name IN "
+            "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s)",
+            [table, table],
+        )
+        return cursor.fetchone()[0] or 0
+
+
+def list_latency(client, url, repeat):
+    client.get(url)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(url)
+    elapsed = (time.perf_counter() - start) / repeat
+    return elapsed, response.data["count"]
+
+
+def report(label, client, repeat):
+    hot = table_size("reastaurant_booking")
+    archive = table_size("reastaurant_archivedbooking")
+    print(f"{label}:")
+    print(f"  booking table          {hot / 2**20:10.1f} MiB")
+    print(f"  archive table          {archive / 2**20:10.1f} MiB")
+    for url in ("/api/bookings/", "/api/bookings/?include_archived=true"):
+        elapsed, count = list_latency(client, url, repeat)
+        print(f"  GET {url:<36} {elapsed * 1000:8.2f} ms ({count} bookings)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    start = time.perf_counter()
+    user = seed(args.rows, args.users)
+    print(f"Seeded {args.rows} past bookings in {time.perf_counter() - start:.1f}s")
+
+    client = APIClient()
+    client.force_authenticate(user)
+    report("Before archiving", client, args.repeat)
+
+    start = time.perf_counter()
+    call_command(
+        "archive_bookings", "--batch-size", str(args.batch_size), stdout=StringIO()
+    )
+    print(f"Archived in {time.perf_counter() - start:.1f}s")
+    with connection.cursor() as cursor:
+        cursor.execute("VACUUM")
+    report("After archiving", client, args.repeat)
+
+    connection.close()
+    DB_FILE.unlink()
+    DB_FILE.parent.rmdir()
+
+
+if __name__ == "__main__":
+    main()
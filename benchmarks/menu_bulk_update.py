@@ -0,0 +1,83 @@
+"""
+Benchmark a menu-wide +5% price change: Menu.objects.bulk_adjust() against
+updating the items one by one, the way repeated PUT /api/menu/{id}/ calls do.
+
+Runs against the in-memory SQLite database of littlelemon.test_settings:
+
+    python benchmarks/menu_bulk_update.py [--items 50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "littlelemon.test_settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+
+from reastaurant.models import Menu, MenuPriceHistory  # noqa: E402
+from reastaurant.query_budget import QueryRecorder  # noqa: E402
+
+FACTOR = Decimal("1.05")
+
+
+def seed(items):
+    Menu.objects.all().delete()
+    MenuPriceHistory.objects.all().delete()
+    Menu.objects.bulk_create(
+        Menu(title=f"Item {i}", price=Decimal("10.00") + i % 500, inventory=10)
+        for i in range(items)
+    )
+
+
+def per_item():
+    for menu in Menu.objects.all():
+        old_price = menu.price
+        menu.price = (old_price * FACTOR).quantize(Decimal("0.01"))
+        menu.save()
+        MenuPriceHistory.objects.create(
+            menu=menu, old_price=old_price, new_price=menu.price
+        )
+
+
+def bulk():
+    Menu.objects.all().bulk_adjust(price_percent=5)
+
+
+def run(name, func, items):
+    seed(items)
+    with QueryRecorder() as recorder:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+    history = MenuPriceHistory.objects.count()
+    print(
+        f"{name:<10} {elapsed:8.3f}s {len(recorder):>8} queries "
+        f"{history:>8} history rows"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=50_000)
+    args = parser.parse_args()
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+    print(f"{args.items} menu items, +5% price")
+    slow = run("per-item", per_item, args.items)
+    fast = run("bulk", bulk, args.items)
+    print(f"speedup    {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
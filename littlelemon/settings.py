@@ -146,6 +146,13 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
 }
+
+# How often (at most) each worker checks whether its menu snapshot is stale
+MENU_SNAPSHOT_CHECK_INTERVAL_MS = 1000
+
+# Records per-endpoint query counts and enforces reastaurant/query_budgets.json
+TEST_RUNNER = "reastaurant.test_runner.QueryBudgetRunner"
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
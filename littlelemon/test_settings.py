@@ -0,0 +1,28 @@
+"""
+Settings used by `manage.py test`.
+
+Runs the suite against an in-memory SQLite database (cloned once per worker
+with `--parallel`) and a cheap password hasher instead of MySQL and PBKDF2.
+"""
+
+from .settings import *  # noqa: F401, F403
+from .settings import MIDDLEWARE
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+# Hashing is not under test; PBKDF2 dominates every create_user/login call.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+# Test data is rolled back between tests, so always check the menu version.
+MENU_SNAPSHOT_CHECK_INTERVAL_MS = 0
+
+# Declared here rather than only by the test runner so that workers started
+# with the "spawn" method (macOS, Windows) record queries as well.
+MIDDLEWARE = ["reastaurant.query_budget.QueryCountMiddleware", *MIDDLEWARE]
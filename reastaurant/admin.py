@@ -1,7 +1,23 @@
 from django.contrib import admin
 
-from .models import Booking, Menu
+from .models import Booking, Menu, MenuPriceHistory
 
 # Register your models here.
 admin.site.register(Menu)
 admin.site.register(Booking)
+
+
+@admin.register(MenuPriceHistory)
+class MenuPriceHistoryAdmin(admin.ModelAdmin):
+    """Read-only, the history is only appended to by Menu.objects.bulk_adjust()"""
+
+    list_display = ["menu", "old_price", "new_price", "changed_by", "changed_at"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
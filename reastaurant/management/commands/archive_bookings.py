@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reastaurant.models import ArchivedBooking, Booking
+
+
+def archive_batch(cutoff, batch_size):
+    """
+    Move up to `batch_size` bookings dated before `cutoff` into
+    ArchivedBooking in one short transaction. Returns the number moved.
+    """
+    with transaction.atomic():
+        ids = list(
+            Booking.objects.select_for_update()
+            .filter(booking_date__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+        # Copy with INSERT ... SELECT so rows never go through Python.
+        quote = connection.ops.quote_name
+        columns = ", ".join(
+            quote(Booking._meta.get_field(field).column)
+            for field in ArchivedBooking.BOOKING_FIELDS
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(ArchivedBooking._meta.db_table)} "
+                f"({columns}, {quote('archived_at')}) "
+                f"SELECT {columns}, %s FROM {quote(Booking._meta.db_table)} "
+                f"WHERE {quote('id')} BETWEEN %s AND %s "
+                f"AND {quote('booking_date')} < %s",
+                [
+                    connection.ops.adapt_datetimefield_value(timezone.now()),
+                    ids[0],
+                    ids[-1],
+                    connection.ops.adapt_datefield_value(cutoff),
+                ],
+            )
+        Booking.objects.filter(
+            id__range=(ids[0], ids[-1]), booking_date__lt=cutoff
+        ).delete()
+    return len(ids)
+
+
+class Command(BaseCommand):
+    help = "Move past bookings into the archive table in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Archive bookings dated more than this many days ago (default 90).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Bookings moved per transaction (default 1000).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches to let other writers in.",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        cutoff = timezone.localdate() - timedelta(days=options["days"])
+        total = 0
+        while moved := archive_batch(cutoff, options["batch_size"]):
+            total += moved
+            if options["pause"]:
+                time.sleep(options["pause"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {total} bookings dated before {cutoff}.")
+        )
@@ -0,0 +1,102 @@
+"""
+Per-process, read-only copy of the menu used by MenuView list/retrieve.
+
+The menu is small and changes rarely, so every worker keeps an immutable
+`MenuSnapshot` and only asks the database for `MenuVersion.current()`, at
+most once every MENU_SNAPSHOT_CHECK_INTERVAL_MS. When the version moved a
+new snapshot is built and swapped in with a single assignment, so readers
+never need a lock and never see a half built menu. Reads inside a
+transaction bypass the snapshot and go to the database.
+
+Snapshots only move when MenuVersion does. Model saves and deletes bump it
+through signals and MenuQuerySet bumps it for update(), bulk_create(),
+bulk_update() and bulk_adjust(); any other write to the menu table, such as
+raw SQL, must call MenuVersion.bump() or workers keep serving the old menu.
+"""
+
+import threading
+import time
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import connection
+
+from .models import Menu, MenuVersion
+
+
+class MenuRecord:
+    """Immutable menu item with the fields MenuSerializer reads"""
+
+    __slots__ = ("id", "title", "price", "inventory")
+
+    def __init__(self, id, title, price, inventory):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "price", price)
+        object.__setattr__(self, "inventory", inventory)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MenuRecord is immutable")
+
+    @property
+    def pk(self):
+        return self.id
+
+    def __repr__(self):
+        return f"<MenuRecord {self.id}: {self.title}>"
+
+
+class MenuSnapshot:
+    """The whole menu at one version, in Menu.Meta.ordering and by id"""
+
+    __slots__ = ("version", "items", "by_id")
+
+    def __init__(self, version, items):
+        self.version = version
+        self.items = tuple(items)
+        self.by_id = MappingProxyType({item.id: item for item in self.items})
+
+    @classmethod
+    def load(cls, version):
+        """
+        Build the snapshot for `version`, which must be read before the rows:
+        a change committed in between only makes the snapshot newer than its
+        version, and the next check rebuilds it.
+        """
+        rows = Menu.objects.values_list("id", "title", "price", "inventory")
+        return cls(version, (MenuRecord(*row) for row in rows))
+
+
+class MenuSnapshotCache:
+    def __init__(self):
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        if connection.in_atomic_block:
+            # The shared snapshot only holds committed data and may not match
+            # what this transaction sees (e.g. its own uncommitted writes).
+            return MenuSnapshot.load(MenuVersion.current())
+        snapshot = self._snapshot
+        interval = settings.MENU_SNAPSHOT_CHECK_INTERVAL_MS / 1000
+        if snapshot is not None and time.monotonic() - self._checked_at < interval:
+            return snapshot
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock.
+            snapshot = self._snapshot
+            if snapshot is not None and time.monotonic() - self._checked_at < interval:
+                return snapshot
+            version = MenuVersion.current()
+            if snapshot is None or version != snapshot.version:
+                snapshot = MenuSnapshot.load(version)
+                self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    def invalidate(self):
+        """Drop the snapshot so the next get() reloads it"""
+        self._snapshot = None
+
+
+menu_snapshot = MenuSnapshotCache()
@@ -1,11 +1,138 @@
+from decimal import Decimal
+
 from django.contrib.auth.models import User
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.backends.base.operations import BaseDatabaseOperations
+from django.db.models import F, Value
+from django.db.models.functions import Round
+from django.utils import timezone
+
+
+def _check_bounds(rows):
+    """
+    Raise ValidationError if any (id, price, new_price, new_inventory) row
+    would end up negative or too large for its column.
+    """
+    price_field = Menu._meta.get_field("price")
+    max_price = Decimal(10) ** (price_field.max_digits - price_field.decimal_places)
+    max_price -= Decimal(10) ** -price_field.decimal_places
+    # The portable range; SQLite itself would accept 64-bit values.
+    _, max_inventory = BaseDatabaseOperations.integer_field_ranges["IntegerField"]
+    bad_price = [row[0] for row in rows if not 0 <= row[2] <= max_price]
+    bad_inventory = [row[0] for row in rows if not 0 <= row[3] <= max_inventory]
+    errors = {}
+    if bad_price:
+        errors["price"] = (
+            f"Price must stay between 0 and {max_price}; "
+            f"the change would break it for items {bad_price}."
+        )
+    if bad_inventory:
+        errors["inventory"] = (
+            f"Inventory must stay between 0 and {max_inventory}; "
+            f"the change would break it for items {bad_inventory}."
+        )
+    if errors:
+        raise ValidationError(errors)
+
+
+class MenuQuerySet(models.QuerySet):
+    """
+    Writes that skip the post_save/post_delete signals bump MenuVersion
+    themselves, in the same transaction, so menu snapshots notice them
+    (bulk_update() goes through update()). Raw SQL writes to the menu table
+    must call MenuVersion.bump() too.
+    """
+
+    def update(self, **kwargs):
+        with transaction.atomic(using=self.db):
+            updated = super().update(**kwargs)
+            if updated:
+                MenuVersion.bump()
+        return updated
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            if created:
+                MenuVersion.bump()
+        return created
+
+    def bulk_adjust(
+        self,
+        price=None,
+        price_delta=None,
+        price_percent=None,
+        inventory=None,
+        inventory_delta=None,
+        changed_by=None,
+    ):
+        """
+        Apply one price and/or inventory change to every item in the queryset
+        with a single UPDATE, log the price changes in MenuPriceHistory and
+        bump the menu version once. Returns the number of items updated.
+
+        Raises ValidationError, changing nothing, if any item's price or
+        inventory would go below 0 or past what its column can hold.
+        """
+        updates = {}
+        if price is not None:
+            updates["price"] = Value(price, output_field=Menu._meta.get_field("price"))
+        elif price_delta is not None:
+            updates["price"] = F("price") + price_delta
+        elif price_percent is not None:
+            factor = 1 + Decimal(price_percent) / 100
+            updates["price"] = Round(F("price") * factor, 2)
+        if inventory is not None:
+            updates["inventory"] = Value(
+                inventory, output_field=Menu._meta.get_field("inventory")
+            )
+        elif inventory_delta is not None:
+            updates["inventory"] = F("inventory") + inventory_delta
+        if not updates:
+            return 0
+
+        with transaction.atomic():
+            # Evaluate the new values with the UPDATE's own expressions while
+            # locking the rows, to check them and to write history without
+            # a second read.
+            rows = list(
+                self.select_for_update()
+                .order_by()
+                .annotate(
+                    new_price=updates.get("price", F("price")),
+                    new_inventory=updates.get("inventory", F("inventory")),
+                )
+                .values_list("id", "price", "new_price", "new_inventory")
+            )
+            if not rows:
+                return 0
+            _check_bounds(rows)
+            # The plain UPDATE; the version is bumped once below.
+            updated = super(MenuQuerySet, self.order_by()).update(**updates)
+            if "price" in updates:
+                changed_at = timezone.now()
+                MenuPriceHistory.objects.bulk_create(
+                    MenuPriceHistory(
+                        menu_id=menu_id,
+                        old_price=old_price,
+                        new_price=new_price,
+                        changed_by=changed_by,
+                        changed_at=changed_at,
+                    )
+                    for menu_id, old_price, new_price, _ in rows
+                    if new_price != old_price
+                )
+            MenuVersion.bump()
+        return updated
 
 
 class Menu(models.Model):
     title = models.CharField(max_length=255)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     inventory = models.IntegerField(default=0)
+
+    objects = MenuQuerySet.as_manager()
     
     class Meta:
         ordering = ['id']
@@ -14,6 +141,48 @@ class Menu(models.Model):
         return self.title
 
 
+class MenuPriceHistory(models.Model):
+    menu = models.ForeignKey(
+        Menu, on_delete=models.CASCADE, related_name="price_history"
+    )
+    old_price = models.DecimalField(max_digits=10, decimal_places=2)
+    new_price = models.DecimalField(max_digits=10, decimal_places=2)
+    changed_by = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    changed_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.menu_id}: {self.old_price} -> {self.new_price}"
+
+
+class MenuVersion(models.Model):
+    """Single row counter bumped whenever the menu changes"""
+
+    version = models.PositiveBigIntegerField(default=0)
+
+    @classmethod
+    def bump(cls):
+        from .menu_snapshot import menu_snapshot
+
+        # The row is created after migrate (see signals.create_menu_version),
+        # so bumping never races another process inserting it.
+        cls.objects.filter(pk=1).update(version=F("version") + 1)
+        # Reload this worker's snapshot once the change is visible to it;
+        # other workers notice the new version on their next check.
+        transaction.on_commit(menu_snapshot.invalidate)
+
+    @classmethod
+    def current(cls):
+        return cls.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+    def __str__(self):
+        return str(self.version)
+
+
 class Booking(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=255)
@@ -23,6 +192,40 @@ class Booking(models.Model):
     
     class Meta:
         ordering = ['booking_date', 'booking_time']
+        indexes = [models.Index(fields=['booking_date', 'booking_time'])]
     
     def __str__(self):
         return f"{self.name} - {self.booking_date} at {self.booking_time}"
+
+
+class ArchivedBooking(models.Model):
+    """Past bookings moved out of Booking by the archive_bookings command"""
+
+    # Same id as the Booking row it was moved from.
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    name = models.CharField(max_length=255)
+    no_of_guests = models.IntegerField()
+    booking_date = models.DateField()
+    booking_time = models.TimeField()
+    archived_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    # Columns copied from Booking when archiving
+    BOOKING_FIELDS = [
+        "id",
+        "user_id",
+        "name",
+        "no_of_guests",
+        "booking_date",
+        "booking_time",
+    ]
+
+    class Meta:
+        ordering = ['booking_date', 'booking_time']
+
+    def __str__(self):
+        return f"{self.name} - {self.booking_date} at {self.booking_time}"
+
+    def to_booking(self):
+        """Unsaved Booking with the same values, for use with BookingSerializer"""
+        return Booking(**{field: getattr(self, field) for field in self.BOOKING_FIELDS})
@@ -0,0 +1,279 @@
+"""
+Query counting helpers used by the test suite.
+
+`QueryRecorder` captures the SQL issued on a connection, `QueryCountMixin`
+adds assertions on top of it for `TestCase` classes, and
+`QueryCountMiddleware` records every request that goes through the test
+client into the module level `ledger`. The `QueryBudgetRunner` in
+`reastaurant.test_runner` compares the ledger against `query_budgets.json`
+once the suite has finished, and checks that every DRF view routed in the
+URLconf (`api_endpoints()`) has a budget.
+"""
+
+import functools
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import URLResolver, get_resolver
+from rest_framework.views import APIView
+
+BUDGET_FILE = Path(__file__).resolve().parent / "query_budgets.json"
+
+# A query shape seen this many times within one request is reported as N+1.
+REPEATED_QUERY_THRESHOLD = 3
+
+# Directory shared with parallel test workers, see QueryLedger.
+LEDGER_DIR_ENV = "QUERY_LEDGER_DIR"
+
+_IN_LIST_RE = re.compile(r"\bIN \((?:%s, )*%s\)")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def query_shape(sql):
+    """Reduce a query to its shape so repeated lookups compare equal"""
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    return _LITERAL_RE.sub("?", sql)
+
+
+def find_repeated_queries(queries, threshold=REPEATED_QUERY_THRESHOLD):
+    """Return {shape: count} for every shape issued at least `threshold` times"""
+    counts = Counter(query_shape(sql) for sql in queries)
+    return {shape: count for shape, count in counts.items() if count >= threshold}
+
+
+class QueryRecorder:
+    """Context manager that records the SQL executed on a connection"""
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.connection = connections[using]
+        self.queries = []
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.lstrip().upper().startswith(_IGNORED_PREFIXES):
+            self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+
+    def __len__(self):
+        return len(self.queries)
+
+    def repeated(self, threshold=REPEATED_QUERY_THRESHOLD):
+        return find_repeated_queries(self.queries, threshold)
+
+
+class _QueryAssertion:
+    def __init__(self, test_case, max_queries, threshold, using):
+        self.test_case = test_case
+        self.max_queries = max_queries
+        self.threshold = threshold
+        self.recorder = QueryRecorder(using)
+
+    def __enter__(self):
+        return self.recorder.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return
+        queries = "\n".join(
+            f"{i}. {sql}" for i, sql in enumerate(self.recorder.queries, start=1)
+        )
+        if self.max_queries is not None and len(self.recorder) > self.max_queries:
+            self.test_case.fail(
+                f"{len(self.recorder)} queries executed, at most "
+                f"{self.max_queries} expected\nCaptured queries were:\n{queries}"
+            )
+        if self.threshold is not None:
+            repeated = self.recorder.repeated(self.threshold)
+            if repeated:
+                shapes = "\n".join(
+                    f"{count}x {shape}" for shape, count in repeated.items()
+                )
+                self.test_case.fail(f"Possible N+1 queries detected:\n{shapes}")
+
+
+class QueryCountMixin:
+    """Query count assertions for `TestCase` classes"""
+
+    def assertMaxQueries(self, max_queries, using=DEFAULT_DB_ALIAS):
+        return _QueryAssertion(self, max_queries, None, using)
+
+    def assertNoRepeatedQueries(
+        self, threshold=REPEATED_QUERY_THRESHOLD, using=DEFAULT_DB_ALIAS
+    ):
+        return _QueryAssertion(self, None, threshold, using)
+
+
+def query_budget(max_queries=None, threshold=REPEATED_QUERY_THRESHOLD):
+    """
+    Decorate a test method so the whole test body stays within `max_queries`
+    and never repeats a query shape `threshold` times.
+    """
+
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        def wrapper(self, *args, **kwargs):
+            with _QueryAssertion(self, max_queries, threshold, DEFAULT_DB_ALIAS):
+                return test_func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _walk_api_views(patterns, prefix=""):
+    """Yield (URL prefix, pattern) for every routed DRF view"""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk_api_views(
+                pattern.url_patterns, prefix + str(pattern.pattern)
+            )
+        elif issubclass(getattr(pattern.callback, "cls", object), APIView):
+            yield prefix, pattern
+
+
+def _view_methods(callback):
+    # Router views map methods to actions; plain APIViews define handlers.
+    actions = getattr(callback, "actions", None)
+    if actions:
+        return set(actions) - {"head"}
+    return {
+        method
+        for method in callback.cls.http_method_names
+        if method not in ("head", "options") and hasattr(callback.cls, method)
+    }
+
+
+@functools.cache
+def _endpoint_names():
+    """
+    Map each routed DRF view to its URL name qualified by the prefix it is
+    mounted under, so the `api-root` of `api/` and `api/auth/` differ.
+    """
+    return {
+        pattern.callback: prefix + pattern.name
+        for prefix, pattern in _walk_api_views(get_resolver().url_patterns)
+    }
+
+
+def api_endpoints():
+    """Every key `endpoint_key` can produce for the routed DRF views"""
+    return {
+        f"{method.upper()} {name}"
+        for callback, name in _endpoint_names().items()
+        for method in _view_methods(callback)
+    }
+
+
+def endpoint_key(request):
+    """Identify a request by method and URL name, e.g. 'GET api/menu-list'"""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        name = request.path
+    else:
+        name = _endpoint_names().get(match.func, match.view_name)
+    return f"{request.method} {name}"
+
+
+class QueryLedger:
+    """
+    Worst case query count and repeated shapes seen per endpoint.
+
+    When `QUERY_LEDGER_DIR` is set every record is also appended to a file
+    named after the process, so counts from parallel test workers can be
+    merged back with `load()`.
+    """
+
+    def __init__(self):
+        self.max_queries = {}
+        self.repeated = {}
+
+    def record(self, endpoint, recorder):
+        entry = [endpoint, len(recorder), recorder.repeated()]
+        self._add(*entry)
+        ledger_dir = os.environ.get(LEDGER_DIR_ENV)
+        if ledger_dir:
+            path = Path(ledger_dir) / f"{os.getpid()}.jsonl"
+            with open(path, "a") as ledger_file:
+                ledger_file.write(json.dumps(entry) + "\n")
+
+    def _add(self, endpoint, count, repeated):
+        if count >= self.max_queries.get(endpoint, -1):
+            self.max_queries[endpoint] = count
+        if repeated:
+            self.repeated.setdefault(endpoint, {}).update(repeated)
+
+    def load(self, ledger_dir):
+        self.clear()
+        for path in sorted(Path(ledger_dir).glob("*.jsonl")):
+            with open(path) as ledger_file:
+                for line in ledger_file:
+                    self._add(*json.loads(line))
+
+    def clear(self):
+        self.max_queries.clear()
+        self.repeated.clear()
+
+    def violations(self, budgets, endpoints=()):
+        """
+        Describe every recorded endpoint over or missing its budget, every
+        N+1 suspect, and every one of `endpoints` with no budget at all.
+        """
+        untested = set(endpoints) - budgets.keys() - self.max_queries.keys()
+        problems = [
+            f"{endpoint}: no budget recorded, add a test that calls it"
+            for endpoint in sorted(untested)
+        ]
+        for endpoint, count in sorted(self.max_queries.items()):
+            budget = budgets.get(endpoint)
+            if budget is None:
+                problems.append(f"{endpoint}: {count} queries, no budget recorded")
+            elif count > budget:
+                problems.append(f"{endpoint}: {count} queries, budget is {budget}")
+        for endpoint, shapes in sorted(self.repeated.items()):
+            for shape, count in shapes.items():
+                problems.append(f"{endpoint}: N+1 suspected, {count}x {shape}")
+        return problems
+
+
+ledger = QueryLedger()
+
+
+class QueryCountMiddleware:
+    """Record the queries of every request into `ledger`"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+        ledger.record(endpoint_key(request), recorder)
+        return response
+
+
+def load_budgets(path=BUDGET_FILE):
+    try:
+        with open(path) as budget_file:
+            return json.load(budget_file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_budgets(budgets, path=BUDGET_FILE):
+    with open(path, "w") as budget_file:
+        json.dump(dict(sorted(budgets.items())), budget_file, indent=2)
+        budget_file.write("\n")
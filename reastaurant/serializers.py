@@ -1,4 +1,5 @@
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
 from .models import Booking, Menu
@@ -10,6 +11,69 @@ class MenuSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "price", "inventory"]
 
 
+class MenuBulkUpdateSerializer(serializers.Serializer):
+    # Which items to update; with no filter the whole menu is updated.
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False)
+    title = serializers.CharField(required=False)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    # What to change; at most one price and one inventory change.
+    price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False, min_value=0
+    )
+    price_delta = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False
+    )
+    price_percent = serializers.DecimalField(
+        max_digits=6, decimal_places=2, required=False, min_value=-100
+    )
+    inventory = serializers.IntegerField(required=False, min_value=0)
+    inventory_delta = serializers.IntegerField(required=False)
+
+    PRICE_FIELDS = ["price", "price_delta", "price_percent"]
+    INVENTORY_FIELDS = ["inventory", "inventory_delta"]
+
+    def validate(self, attrs):
+        price_changes = [f for f in self.PRICE_FIELDS if f in attrs]
+        inventory_changes = [f for f in self.INVENTORY_FIELDS if f in attrs]
+        if len(price_changes) > 1 or len(inventory_changes) > 1:
+            raise serializers.ValidationError(
+                "Provide at most one of price, price_delta, price_percent and "
+                "at most one of inventory, inventory_delta."
+            )
+        if not price_changes and not inventory_changes:
+            raise serializers.ValidationError("No price or inventory change given.")
+        return attrs
+
+    def get_queryset(self):
+        queryset = Menu.objects.all()
+        data = self.validated_data
+        if "ids" in data:
+            queryset = queryset.filter(id__in=data["ids"])
+        if "title" in data:
+            queryset = queryset.filter(title__icontains=data["title"])
+        if "min_price" in data:
+            queryset = queryset.filter(price__gte=data["min_price"])
+        if "max_price" in data:
+            queryset = queryset.filter(price__lte=data["max_price"])
+        return queryset
+
+    def save(self, changed_by=None):
+        changes = {
+            field: self.validated_data[field]
+            for field in self.PRICE_FIELDS + self.INVENTORY_FIELDS
+            if field in self.validated_data
+        }
+        try:
+            return self.get_queryset().bulk_adjust(changed_by=changed_by, **changes)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(exc.message_dict)
+
+
 class BookingSerializer(serializers.ModelSerializer):
     class Meta:
         model = Booking
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Menu, MenuVersion
+
+
+@receiver(post_save, sender=Menu)
+@receiver(post_delete, sender=Menu)
+def bump_menu_version(sender, **kwargs):
+    # Menu.objects.bulk_adjust() bumps the version itself, once per batch.
+    MenuVersion.bump()
+
+
+def create_menu_version(using, **kwargs):
+    """Create the MenuVersion counter row, connected to post_migrate"""
+    MenuVersion.objects.using(using).get_or_create(pk=1)
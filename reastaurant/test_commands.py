@@ -0,0 +1,76 @@
+from datetime import date, time, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from .models import ArchivedBooking, Booking
+
+
+class ArchiveBookingsCommandTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="testuser")
+        today = date.today()
+        cls.old_bookings = [
+            Booking.objects.create(
+                user=cls.user,
+                name=f"Old {i}",
+                no_of_guests=2,
+                booking_date=today - timedelta(days=100 + i),
+                booking_time=time(19, 00),
+            )
+            for i in range(5)
+        ]
+        cls.recent_booking = Booking.objects.create(
+            user=cls.user,
+            name="Recent",
+            no_of_guests=4,
+            booking_date=today - timedelta(days=10),
+            booking_time=time(20, 00),
+        )
+        cls.upcoming_booking = Booking.objects.create(
+            user=cls.user,
+            name="Upcoming",
+            no_of_guests=4,
+            booking_date=today + timedelta(days=10),
+            booking_time=time(20, 00),
+        )
+
+    def archive(self, *args):
+        out = StringIO()
+        call_command("archive_bookings", *args, stdout=out)
+        return out.getvalue()
+
+    def test_moves_old_bookings_in_batches(self):
+        output = self.archive("--days", "90", "--batch-size", "2")
+        self.assertIn("Archived 5 bookings", output)
+        self.assertEqual(
+            set(Booking.objects.values_list("id", flat=True)),
+            {self.recent_booking.id, self.upcoming_booking.id},
+        )
+        self.assertEqual(
+            set(ArchivedBooking.objects.values_list("id", flat=True)),
+            {booking.id for booking in self.old_bookings},
+        )
+
+    def test_archived_copy_keeps_values(self):
+        self.archive()
+        booking = self.old_bookings[0]
+        archived = ArchivedBooking.objects.get(id=booking.id)
+        self.assertEqual(archived.user, self.user)
+        self.assertEqual(archived.name, booking.name)
+        self.assertEqual(archived.booking_date, booking.booking_date)
+        self.assertEqual(archived.booking_time, booking.booking_time)
+
+    def test_horizon(self):
+        self.archive("--days", "0")
+        self.assertEqual(Booking.objects.get().id, self.upcoming_booking.id)
+
+    def test_nothing_to_archive(self):
+        self.assertIn("Archived 0 bookings", self.archive("--days", "1000"))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(CommandError):
+            self.archive("--batch-size", "0")
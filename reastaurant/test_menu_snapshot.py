@@ -0,0 +1,139 @@
+import threading
+from decimal import Decimal
+from unittest import mock
+
+from django.db import transaction
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .menu_snapshot import MenuRecord, MenuSnapshot, MenuSnapshotCache, menu_snapshot
+from .models import Menu, MenuVersion
+
+
+# The snapshot only follows committed changes, so these tests run outside a
+# test transaction.
+class MenuSnapshotTest(TransactionTestCase):
+    def setUp(self):
+        self.pasta = Menu.objects.create(title="Pasta", price=12.99, inventory=50)
+        self.salad = Menu.objects.create(title="Salad", price=8.50, inventory=10)
+
+    def test_load_follows_menu_ordering(self):
+        snapshot = MenuSnapshot.load(MenuVersion.current())
+        self.assertEqual(
+            [item.id for item in snapshot.items], [self.pasta.id, self.salad.id]
+        )
+        self.assertEqual(snapshot.by_id[self.salad.id].price, Decimal("8.50"))
+
+    def test_records_are_immutable(self):
+        snapshot = MenuSnapshot.load(MenuVersion.current())
+        with self.assertRaises(AttributeError):
+            snapshot.items[0].price = Decimal("1.00")
+        with self.assertRaises(TypeError):
+            snapshot.by_id[0] = snapshot.items[0]
+
+    def test_reloads_when_version_changes(self):
+        cache = MenuSnapshotCache()
+        first = cache.get()
+        self.assertIs(cache.get(), first)
+        Menu.objects.filter(id=self.pasta.id).bulk_adjust(price=Decimal("13.50"))
+        second = cache.get()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.by_id[self.pasta.id].price, Decimal("13.50"))
+
+    @override_settings(MENU_SNAPSHOT_CHECK_INTERVAL_MS=60_000)
+    def test_version_check_is_debounced(self):
+        cache = MenuSnapshotCache()
+        cache.get()
+        with self.assertNumQueries(0):
+            cache.get()
+
+    @override_settings(MENU_SNAPSHOT_CHECK_INTERVAL_MS=60_000)
+    def test_local_change_invalidates(self):
+        cache = MenuSnapshotCache()
+        cache.get()
+        with mock.patch("reastaurant.menu_snapshot.menu_snapshot", cache):
+            Menu.objects.create(title="Soup", price=6.00)
+        self.assertEqual(len(cache.get().items), 3)
+
+    def test_queryset_update_reloads(self):
+        cache = MenuSnapshotCache()
+        cache.get()
+        Menu.objects.filter(id=self.salad.id).update(inventory=0)
+        self.assertEqual(cache.get().by_id[self.salad.id].inventory, 0)
+
+    def test_reads_inside_a_transaction_skip_the_snapshot(self):
+        cache = MenuSnapshotCache()
+        cache.get()
+        with transaction.atomic():
+            Menu.objects.filter(id=self.pasta.id).bulk_adjust(price=Decimal("13.50"))
+            self.assertEqual(
+                cache.get().by_id[self.pasta.id].price, Decimal("13.50")
+            )
+            transaction.set_rollback(True)
+        self.assertEqual(cache.get().by_id[self.pasta.id].price, Decimal("12.99"))
+
+
+class MenuSnapshotThreadingTest(SimpleTestCase):
+    def test_concurrent_refresh_loads_once(self):
+        cache = MenuSnapshotCache()
+        snapshot = MenuSnapshot(1, [MenuRecord(1, "Pasta", Decimal("12.99"), 50)])
+        start = threading.Barrier(8)
+        results = []
+
+        def read():
+            start.wait()
+            results.append(cache.get())
+
+        with (
+            mock.patch.object(MenuVersion, "current", return_value=1),
+            mock.patch.object(MenuSnapshot, "load", return_value=snapshot) as load,
+        ):
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(load.call_count, 1)
+        self.assertTrue(all(result is snapshot for result in results))
+
+
+class MenuViewSnapshotTest(TransactionTestCase):
+    client_class = APIClient
+
+    def setUp(self):
+        self.menu_item = Menu.objects.create(
+            title="Pasta Carbonara", price=12.99, inventory=50
+        )
+
+    @override_settings(MENU_SNAPSHOT_CHECK_INTERVAL_MS=60_000)
+    def test_steady_state_uses_no_queries(self):
+        menu_snapshot.invalidate()
+        self.client.get("/api/menu/", format="json")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/menu/", format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response = self.client.get(
+                f"/api/menu/{self.menu_item.id}/", format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["price"], "12.99")
+
+    def test_list_matches_serializer_output(self):
+        response = self.client.get("/api/menu/", format="json")
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(
+            dict(response.data["results"][0]),
+            {
+                "id": self.menu_item.id,
+                "title": "Pasta Carbonara",
+                "price": "12.99",
+                "inventory": 50,
+            },
+        )
+
+    def test_retrieve_missing_item(self):
+        response = self.client.get("/api/menu/0/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get("/api/menu/abc/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,15 +1,19 @@
 from datetime import date, time
 from decimal import Decimal
 
+from django.contrib import admin
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.test import RequestFactory, TestCase
 
-from .models import Booking, Menu
+from .models import Booking, Menu, MenuPriceHistory, MenuVersion
+from .query_budget import QueryCountMixin
 
 
 class MenuModelTest(TestCase):
-    def setUp(self):
-        self.menu_item = Menu.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.menu_item = Menu.objects.create(
             title="Pasta Carbonara", price=12.99, inventory=50
         )
 
@@ -47,14 +51,132 @@ class MenuModelTest(TestCase):
         self.menu_item.delete()
         self.assertFalse(Menu.objects.filter(id=menu_id).exists())
 
+    def test_queryset_writes_bump_version(self):
+        version = MenuVersion.current()
+        Menu.objects.filter(id=self.menu_item.id).update(inventory=40)
+        self.assertEqual(MenuVersion.current(), version + 1)
+        items = Menu.objects.bulk_create(
+            [Menu(title="Soup", price=6.00), Menu(title="Bread", price=3.00)]
+        )
+        self.assertEqual(MenuVersion.current(), version + 2)
+        for item in items:
+            item.inventory = 5
+        Menu.objects.bulk_update(items, ["inventory"])
+        self.assertEqual(MenuVersion.current(), version + 3)
+
+    def test_empty_queryset_writes_keep_version(self):
+        version = MenuVersion.current()
+        Menu.objects.filter(id=0).update(inventory=40)
+        Menu.objects.bulk_create([])
+        Menu.objects.bulk_update([], ["inventory"])
+        self.assertEqual(MenuVersion.current(), version)
+
+
+class MenuBulkAdjustTest(QueryCountMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="staffuser", is_staff=True)
+        cls.pasta = Menu.objects.create(title="Pasta", price=10.00, inventory=5)
+        cls.fish = Menu.objects.create(title="Grilled Fish", price=19.99, inventory=3)
+        cls.salad = Menu.objects.create(title="Salad", price=8.50, inventory=0)
+
+    def test_price_percent(self):
+        updated = Menu.objects.filter(price__gte=10).bulk_adjust(price_percent=5)
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            list(Menu.objects.values_list("price", flat=True)),
+            [Decimal("10.50"), Decimal("20.99"), Decimal("8.50")],
+        )
+
+    def test_price_history_written(self):
+        Menu.objects.all().bulk_adjust(
+            price_delta=Decimal("1.00"), changed_by=self.user
+        )
+        history = list(MenuPriceHistory.objects.all())
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[0].menu, self.pasta)
+        self.assertEqual(history[0].old_price, Decimal("10.00"))
+        self.assertEqual(history[0].new_price, Decimal("11.00"))
+        self.assertEqual(history[0].changed_by, self.user)
+
+    def test_inventory_only_writes_no_history(self):
+        Menu.objects.filter(title__icontains="fish").bulk_adjust(inventory_delta=10)
+        self.fish.refresh_from_db()
+        self.assertEqual(self.fish.inventory, 13)
+        self.assertFalse(MenuPriceHistory.objects.exists())
+
+    def test_version_bumped_once(self):
+        version = MenuVersion.current()
+        Menu.objects.all().bulk_adjust(price=Decimal("9.99"), inventory=1)
+        self.assertEqual(MenuVersion.current(), version + 1)
+
+    def test_bump_is_a_single_update(self):
+        self.assertTrue(MenuVersion.objects.filter(pk=1).exists())
+        version = MenuVersion.current()
+        with self.assertMaxQueries(1) as recorder:
+            MenuVersion.bump()
+        self.assertTrue(recorder.queries[0].startswith("UPDATE"))
+        self.assertEqual(MenuVersion.current(), version + 1)
+
+    def test_set_based_queries(self):
+        for i in range(20):
+            Menu.objects.create(title=f"Item {i}", price=5.00)
+        # Lock and read old/new prices, UPDATE, INSERT history, bump version
+        with self.assertMaxQueries(4):
+            Menu.objects.all().bulk_adjust(price_percent=-10)
+
+    def test_history_only_reads_selected_rows(self):
+        with self.assertMaxQueries(4) as recorder:
+            Menu.objects.filter(id__in=[self.pasta.id, self.salad.id]).bulk_adjust(
+                price_percent=10
+            )
+        self.assertFalse(any("BETWEEN" in sql for sql in recorder.queries))
+        self.assertEqual(
+            set(MenuPriceHistory.objects.values_list("menu_id", flat=True)),
+            {self.pasta.id, self.salad.id},
+        )
+
+    def test_negative_result_is_rejected(self):
+        with self.assertRaises(ValidationError) as cm:
+            Menu.objects.all().bulk_adjust(price_delta=-9, inventory_delta=-4)
+        self.assertEqual(set(cm.exception.message_dict), {"price", "inventory"})
+        self.pasta.refresh_from_db()
+        self.assertEqual(self.pasta.price, Decimal("10.00"))
+        self.assertEqual(self.pasta.inventory, 5)
+        self.assertFalse(MenuPriceHistory.objects.exists())
+
+    def test_overflow_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            Menu.objects.all().bulk_adjust(price_percent=10**9)
+        with self.assertRaises(ValidationError):
+            Menu.objects.all().bulk_adjust(inventory_delta=2**31)
+        self.fish.refresh_from_db()
+        self.assertEqual(self.fish.price, Decimal("19.99"))
+        self.assertEqual(self.fish.inventory, 3)
+
+    def test_empty_selection(self):
+        version = MenuVersion.current()
+        self.assertEqual(Menu.objects.filter(id=0).bulk_adjust(price=1), 0)
+        self.assertEqual(MenuVersion.current(), version)
+
+    def test_history_is_read_only_in_admin(self):
+        model_admin = admin.site._registry[MenuPriceHistory]
+        request = RequestFactory().get("/admin/")
+        request.user = User.objects.create_superuser(username="admin")
+        self.assertTrue(model_admin.has_view_permission(request))
+        self.assertFalse(model_admin.has_add_permission(request))
+        self.assertFalse(model_admin.has_change_permission(request))
+        self.assertFalse(model_admin.has_delete_permission(request))
+
 
 class BookingModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser", password="testpass123"
         )
-        self.booking = Booking.objects.create(
-            user=self.user,
+        cls.booking = Booking.objects.create(
+            user=cls.user,
             name="John Doe",
             no_of_guests=4,
             booking_date=date(2025, 12, 26),
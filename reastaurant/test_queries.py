@@ -0,0 +1,319 @@
+from datetime import date, time
+
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.test import SimpleTestCase, TestCase, override_settings
+from djoser.utils import encode_uid
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .models import Booking, Menu
+from .query_budget import (
+    QueryCountMixin,
+    QueryLedger,
+    api_endpoints,
+    find_repeated_queries,
+    query_budget,
+    query_shape,
+)
+
+# The reset emails link to the frontend, which djoser needs URL templates for.
+RESET_URLS = {
+    "PASSWORD_RESET_CONFIRM_URL": "reset/password/{uid}/{token}",
+    "USERNAME_RESET_CONFIRM_URL": "reset/username/{uid}/{token}",
+}
+
+
+class QueryShapeTest(SimpleTestCase):
+    def test_literals_are_normalized(self):
+        self.assertEqual(
+            query_shape("SELECT * FROM t WHERE id = 3 AND name = 'it''s'"),
+            "SELECT * FROM t WHERE id = ? AND name = ?",
+        )
+
+    def test_in_lists_are_collapsed(self):
+        self.assertEqual(
+            query_shape("SELECT * FROM t WHERE id IN (%s, %s, %s)"),
+            query_shape("SELECT * FROM t WHERE id IN (%s)"),
+        )
+
+    def test_repeated_queries_are_found(self):
+        queries = ["SELECT * FROM auth_user WHERE id = %s"] * 3 + [
+            "SELECT * FROM reastaurant_booking"
+        ]
+        repeated = find_repeated_queries(queries)
+        self.assertEqual(list(repeated.values()), [3])
+
+    def test_ledger_reports_missing_and_exceeded_budgets(self):
+        ledger = QueryLedger()
+        ledger.max_queries = {"GET menu-list": 3, "GET menu-detail": 1}
+        violations = ledger.violations({"GET menu-list": 2})
+        self.assertEqual(len(violations), 2)
+
+    def test_ledger_reports_untested_endpoints(self):
+        ledger = QueryLedger()
+        ledger.max_queries = {"GET api/menu-list": 2}
+        violations = ledger.violations(
+            {"GET api/menu-list": 2}, {"GET api/menu-list", "DELETE api/menu-detail"}
+        )
+        self.assertEqual(len(violations), 1)
+        self.assertIn("DELETE api/menu-detail", violations[0])
+
+    def test_api_roots_have_separate_keys(self):
+        self.assertLessEqual(
+            {"GET api/api-root", "GET api/auth/api-root", "POST api_token_auth"},
+            api_endpoints(),
+        )
+
+
+class QueryAssertionTest(QueryCountMixin, TestCase):
+    def test_max_queries_fails_when_exceeded(self):
+        with self.assertRaises(AssertionError):
+            with self.assertMaxQueries(1):
+                list(Menu.objects.all())
+                list(Booking.objects.all())
+
+    def test_repeated_queries_fail(self):
+        user = User.objects.create_user(username="testuser")
+        for i in range(3):
+            Booking.objects.create(
+                user=user,
+                name=f"Booking {i}",
+                no_of_guests=2,
+                booking_date=date(2025, 12, 26),
+                booking_time=time(19, 00),
+            )
+        with self.assertRaises(AssertionError):
+            with self.assertNoRepeatedQueries():
+                [booking.user.username for booking in Booking.objects.all()]
+
+    @query_budget(max_queries=1)
+    def test_query_budget_decorator(self):
+        list(Menu.objects.all())
+
+
+class EndpointQueryTest(QueryCountMixin, TestCase):
+    """
+    Exercise every endpoint of reastaurant/urls.py and the djoser routes so
+    the QueryBudgetRunner has a count for each of them; the runner fails for
+    any routed endpoint left out.
+    """
+
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpass123", email="test@example.com"
+        )
+        cls.staff = User.objects.create_user(
+            username="staffuser", password="staffpass123", is_staff=True
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.staff_token = Token.objects.create(user=cls.staff)
+        cls.menu_item = Menu.objects.create(
+            title="Pasta Carbonara", price=12.99, inventory=50
+        )
+        cls.booking = cls.create_booking("John Doe")
+
+    @classmethod
+    def create_booking(cls, name):
+        return Booking.objects.create(
+            user=cls.user,
+            name=name,
+            no_of_guests=4,
+            booking_date=date(2025, 12, 26),
+            booking_time=time(19, 00),
+        )
+
+    def authenticate(self, token=None):
+        token = token or self.token
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
+
+    def test_api_root(self):
+        response = self.client.get("/api/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get("/api/auth/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_menu_list_does_not_grow_with_rows(self):
+        with self.assertNoRepeatedQueries():
+            response = self.client.get("/api/menu/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for i in range(10):
+            Menu.objects.create(title=f"Item {i}", price=10.00)
+        with self.assertMaxQueries(2):
+            self.client.get("/api/menu/", format="json")
+
+    def test_menu_detail(self):
+        url = f"/api/menu/{self.menu_item.id}/"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.authenticate(self.staff_token)
+        data = {"title": "Updated Pasta", "price": 14.99, "inventory": 40}
+        response = self.client.put(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(url, {"inventory": 10}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_menu_create(self):
+        self.authenticate(self.staff_token)
+        data = {"title": "Risotto", "price": 15.99, "inventory": 30}
+        response = self.client.post("/api/menu/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_booking_list_does_not_grow_with_rows(self):
+        self.authenticate()
+        with self.assertNoRepeatedQueries():
+            response = self.client.get("/api/bookings/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for i in range(10):
+            self.create_booking(f"Guest {i}")
+        with self.assertMaxQueries(3):
+            self.client.get("/api/bookings/", format="json")
+
+    def test_booking_create(self):
+        self.authenticate()
+        data = {
+            "name": "Jane Smith",
+            "no_of_guests": 2,
+            "booking_date": "2025-12-27",
+            "booking_time": "20:00",
+        }
+        response = self.client.post("/api/bookings/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_booking_detail(self):
+        self.authenticate()
+        url = f"/api/bookings/{self.booking.id}/"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        data = {
+            "name": "John Updated",
+            "no_of_guests": 6,
+            "booking_date": "2025-12-26",
+            "booking_time": "19:00",
+        }
+        response = self.client.put(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(url, {"no_of_guests": 3}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_register_and_login(self):
+        data = {"username": "newuser", "password": "newpass123"}
+        response = self.client.post("/api/auth/register/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post("/api/auth/login/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_obtain_auth_token(self):
+        data = {"username": "testuser", "password": "testpass123"}
+        response = self.client.post("/api-token-auth/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_djoser_users(self):
+        data = {"username": "djoseruser", "password": "Str0ng-passw0rd!"}
+        response = self.client.post("/api/auth/users/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.authenticate(self.staff_token)
+        response = self.client.get("/api/auth/users/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        url = f"/api/auth/users/{self.user.id}/"
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        response = self.client.patch(url, {"email": "new@example.com"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.put(
+            url, {"email": "put@example.com"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.delete(
+            url, {"current_password": "staffpass123"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_djoser_me(self):
+        self.authenticate()
+        response = self.client.get("/api/auth/users/me/", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(
+            "/api/auth/users/me/", {"email": "me@example.com"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.put(
+            "/api/auth/users/me/", {"email": "put@example.com"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.delete(
+            "/api/auth/users/me/", {"current_password": "testpass123"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_djoser_set_password(self):
+        self.authenticate()
+        data = {"current_password": "testpass123", "new_password": "N3w-passw0rd!"}
+        response = self.client.post(
+            "/api/auth/users/set_password/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_djoser_set_username(self):
+        self.authenticate()
+        data = {"current_password": "testpass123", "new_username": "renamed"}
+        response = self.client.post(
+            "/api/auth/users/set_username/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_djoser_activation(self):
+        inactive = User.objects.create_user(
+            username="inactive", email="inactive@example.com", is_active=False
+        )
+        data = {"email": "inactive@example.com"}
+        response = self.client.post(
+            "/api/auth/users/resend_activation/", data, format="json"
+        )
+        # Activation emails are disabled (djoser's default).
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        data = {
+            "uid": encode_uid(inactive.pk),
+            "token": default_token_generator.make_token(inactive),
+        }
+        response = self.client.post("/api/auth/users/activation/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    @override_settings(DJOSER=RESET_URLS)
+    def test_djoser_reset_password(self):
+        data = {"email": "test@example.com"}
+        response = self.client.post(
+            "/api/auth/users/reset_password/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        data = {
+            "uid": encode_uid(self.user.pk),
+            "token": default_token_generator.make_token(self.user),
+            "new_password": "N3w-passw0rd!",
+        }
+        response = self.client.post(
+            "/api/auth/users/reset_password_confirm/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    @override_settings(DJOSER=RESET_URLS)
+    def test_djoser_reset_username(self):
+        data = {"email": "test@example.com"}
+        response = self.client.post(
+            "/api/auth/users/reset_username/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        data = {
+            "uid": encode_uid(self.user.pk),
+            "token": default_token_generator.make_token(self.user),
+            "new_username": "renamed",
+        }
+        response = self.client.post(
+            "/api/auth/users/reset_username_confirm/", data, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
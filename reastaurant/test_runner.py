@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+from .query_budget import (
+    LEDGER_DIR_ENV,
+    api_endpoints,
+    ledger,
+    load_budgets,
+    save_budgets,
+)
+
+MIDDLEWARE = "reastaurant.query_budget.QueryCountMiddleware"
+
+
+class QueryBudgetRunner(DiscoverRunner):
+    """
+    Test runner that records the queries issued by every request made
+    through the test client and fails the run when an endpoint goes over
+    its entry in `query_budgets.json` or repeats a query shape (N+1). Every
+    routed API endpoint must have an entry, so new views need a test.
+    """
+
+    def __init__(self, update_query_budgets=False, **kwargs):
+        super().__init__(**kwargs)
+        self.update_query_budgets = update_query_budgets
+        self.ledger_dir = None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--update-query-budgets",
+            action="store_true",
+            help="Rewrite query_budgets.json with the query counts of this run.",
+        )
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        ledger.clear()
+        # Parallel workers inherit the environment and write their records here.
+        self.ledger_dir = tempfile.mkdtemp(prefix="query-ledger-")
+        os.environ[LEDGER_DIR_ENV] = self.ledger_dir
+        if MIDDLEWARE not in settings.MIDDLEWARE:
+            # Outermost, so session and authentication queries are counted too.
+            settings.MIDDLEWARE = [MIDDLEWARE, *settings.MIDDLEWARE]
+
+    def run_suite(self, suite, **kwargs):
+        result = super().run_suite(suite, **kwargs)
+        ledger.load(self.ledger_dir)
+        return result
+
+    def teardown_test_environment(self, **kwargs):
+        os.environ.pop(LEDGER_DIR_ENV, None)
+        shutil.rmtree(self.ledger_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
+
+    def suite_result(self, suite, result, **kwargs):
+        failures = super().suite_result(suite, result, **kwargs)
+        endpoints = api_endpoints()
+        budgets = load_budgets()
+        if self.update_query_budgets:
+            # Entries of endpoints that are no longer routed are dropped.
+            budgets = {
+                key: count
+                for key, count in {**budgets, **ledger.max_queries}.items()
+                if key in endpoints
+            }
+            save_budgets(budgets)
+            self.log("Query budgets updated.")
+        violations = ledger.violations(budgets, endpoints)
+        if violations:
+            self.log("Query budget exceeded:")
+            for violation in violations:
+                self.log(f"  {violation}")
+        return failures + len(violations)
@@ -6,17 +6,19 @@ from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
-from .models import Booking, Menu
+from .models import ArchivedBooking, Booking, Menu, MenuPriceHistory, MenuVersion
 
 
 class MenuViewTest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser", password="testpass123"
         )
-        self.token = Token.objects.create(user=self.user)
-        self.menu_item = Menu.objects.create(
+        cls.token = Token.objects.create(user=cls.user)
+        cls.menu_item = Menu.objects.create(
             title="Pasta Carbonara", price=12.99, inventory=50
         )
 
@@ -66,19 +68,97 @@ class MenuViewTest(TestCase):
         self.assertEqual(Menu.objects.count(), 0)
 
 
+class MenuBulkUpdateViewTest(TestCase):
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        cls.staff = User.objects.create_user(
+            username="staffuser", password="staffpass123", is_staff=True
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.staff_token = Token.objects.create(user=cls.staff)
+        cls.pasta = Menu.objects.create(title="Pasta", price=10.00, inventory=5)
+        cls.salad = Menu.objects.create(title="Salad", price=8.00, inventory=5)
+
+    def test_bulk_update_staff(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        version = MenuVersion.current()
+        data = {"ids": [self.pasta.id], "price_percent": 5, "inventory_delta": -1}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 1, "version": version + 1})
+        self.pasta.refresh_from_db()
+        self.assertEqual(str(self.pasta.price), "10.50")
+        self.assertEqual(self.pasta.inventory, 4)
+        history = MenuPriceHistory.objects.get()
+        self.assertEqual(history.changed_by, self.staff)
+
+    def test_bulk_update_non_staff(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        data = {"price_percent": 5}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_update_conflicting_changes(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        data = {"price": 9.99, "price_percent": 5}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_without_changes(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        data = {"title": "pasta"}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_below_zero(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        data = {"price_delta": -100, "inventory_delta": -50}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("price", response.data)
+        self.assertIn("inventory", response.data)
+        self.pasta.refresh_from_db()
+        self.assertEqual(str(self.pasta.price), "10.00")
+        self.assertEqual(self.pasta.inventory, 5)
+
+    def test_bulk_update_overflow(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        Menu.objects.filter(id=self.pasta.id).update(price=99_999_999)
+        data = {"price_percent": 5}
+        response = self.client.post("/api/menu/bulk-update/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("price", response.data)
+
+    def test_single_update_writes_price_history(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.staff_token.key)
+        data = {"title": "Salad", "price": 9.00, "inventory": 5}
+        response = self.client.put(f"/api/menu/{self.salad.id}/", data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        history = MenuPriceHistory.objects.get()
+        self.assertEqual(str(history.old_price), "8.00")
+        self.assertEqual(str(history.new_price), "9.00")
+
+
 class BookingViewTest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username="testuser", password="testpass123"
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username="otheruser", password="otherpass123"
         )
-        self.token = Token.objects.create(user=self.user)
-        self.other_token = Token.objects.create(user=self.other_user)
-        self.booking = Booking.objects.create(
-            user=self.user,
+        cls.token = Token.objects.create(user=cls.user)
+        cls.other_token = Token.objects.create(user=cls.other_user)
+        cls.booking = Booking.objects.create(
+            user=cls.user,
             name="John Doe",
             no_of_guests=4,
             booking_date=date(2025, 12, 26),
@@ -168,6 +248,72 @@ class BookingViewTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Booking.objects.count(), 0)
 
+    def test_booking_list_excludes_archived_by_default(self):
+        archived = ArchivedBooking.objects.create(
+            id=self.booking.id + 100,
+            user=self.user,
+            name="Old Booking",
+            no_of_guests=2,
+            booking_date=date(2024, 1, 1),
+            booking_time=time(19, 00),
+        )
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get("/api/bookings/", format="json")
+        booking_ids = [b["id"] for b in response.data["results"]]
+        self.assertNotIn(archived.id, booking_ids)
+
+    def test_booking_list_include_archived(self):
+        archived = ArchivedBooking.objects.create(
+            id=self.booking.id + 100,
+            user=self.user,
+            name="Old Booking",
+            no_of_guests=2,
+            booking_date=date(2024, 1, 1),
+            booking_time=time(19, 00),
+        )
+        ArchivedBooking.objects.create(
+            id=self.booking.id + 101,
+            user=self.other_user,
+            name="Other Old Booking",
+            no_of_guests=2,
+            booking_date=date(2024, 1, 1),
+            booking_time=time(19, 00),
+        )
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get(
+            "/api/bookings/?include_archived=true", format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        results = response.data["results"]
+        self.assertEqual([b["id"] for b in results], [archived.id, self.booking.id])
+        self.assertEqual(results[0]["user"], self.user.id)
+        self.assertEqual(results[0]["booking_date"], "2024-01-01")
+
+    def test_booking_retrieve_archived(self):
+        archived = ArchivedBooking.objects.create(
+            id=self.booking.id + 100,
+            user=self.user,
+            name="Old Booking",
+            no_of_guests=2,
+            booking_date=date(2024, 1, 1),
+            booking_time=time(19, 00),
+        )
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        url = f"/api/bookings/{archived.id}/"
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(url + "?include_archived=1", format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Old Booking")
+
+    def test_booking_retrieve_archived_invalid_pk(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Token " + self.token.key)
+        response = self.client.get(
+            "/api/bookings/abc/?include_archived=1", format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_booking_user_isolation(self):
         self.client.credentials(HTTP_AUTHORIZATION="Token " + self.other_token.key)
         response = self.client.get(f"/api/bookings/{self.booking.id}/", format="json")
@@ -175,8 +321,7 @@ class BookingViewTest(TestCase):
 
 
 class UserRegistrationViewTest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_user_register(self):
         data = {
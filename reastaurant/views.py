@@ -1,13 +1,17 @@
 from django.contrib.auth import authenticate
+from django.http import Http404
 from rest_framework import status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import AllowAny, BasePermission, IsAuthenticated
 from rest_framework.response import Response
 
-from .models import Booking, Menu
+from .menu_snapshot import menu_snapshot
+from .models import ArchivedBooking, Booking, Menu, MenuPriceHistory, MenuVersion
 from .serializers import (
     BookingSerializer,
+    MenuBulkUpdateSerializer,
     MenuSerializer,
     UserRegistrationSerializer,
     UserSerializer,
@@ -33,6 +37,47 @@ class MenuView(viewsets.ModelViewSet):
             self.permission_classes = [IsStaffUser]
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        # Served from the in-process snapshot, see menu_snapshot.py
+        items = menu_snapshot.get().items
+        page = self.paginate_queryset(items)
+        serializer = self.get_serializer(items if page is None else page, many=True)
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    def get_object(self):
+        if self.action != "retrieve":
+            return super().get_object()
+        try:
+            item = menu_snapshot.get().by_id[int(self.kwargs["pk"])]
+        except (KeyError, ValueError):
+            raise Http404
+        self.check_object_permissions(self.request, item)
+        return item
+
+    def perform_update(self, serializer):
+        old_price = serializer.instance.price
+        menu = serializer.save()
+        if menu.price != old_price:
+            MenuPriceHistory.objects.create(
+                menu=menu,
+                old_price=old_price,
+                new_price=menu.price,
+                changed_by=self.request.user,
+            )
+
+    @action(detail=False, methods=["post"], url_path="bulk-update")
+    def bulk_update(self, request):
+        serializer = MenuBulkUpdateSerializer(data=request.data)
+        if serializer.is_valid():
+            updated = serializer.save(changed_by=request.user)
+            return Response(
+                {"updated": updated, "version": MenuVersion.current()},
+                status=status.HTTP_200_OK,
+            )
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
 
 class BookingView(viewsets.ModelViewSet):
     queryset = Booking.objects.all()
@@ -43,6 +88,41 @@ class BookingView(viewsets.ModelViewSet):
         # Users can only see their own bookings
         return Booking.objects.filter(user=self.request.user)
 
+    def include_archived(self):
+        value = self.request.query_params.get("include_archived", "")
+        return value.lower() in ("1", "true", "yes")
+
+    def list(self, request, *args, **kwargs):
+        if not self.include_archived():
+            return super().list(request, *args, **kwargs)
+        # Archived bookings are only read when explicitly asked for
+        fields = ArchivedBooking.BOOKING_FIELDS
+        archived = ArchivedBooking.objects.filter(user=request.user)
+        queryset = (
+            self.get_queryset()
+            .order_by()
+            .values(*fields)
+            .union(archived.order_by().values(*fields), all=True)
+            .order_by("booking_date", "booking_time", "id")
+        )
+        page = self.paginate_queryset(queryset)
+        bookings = [Booking(**row) for row in (queryset if page is None else page)]
+        serializer = self.get_serializer(bookings, many=True)
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            if self.action != "retrieve" or not self.include_archived():
+                raise
+            archived = get_object_or_404(
+                ArchivedBooking, pk=self.kwargs["pk"], user=self.request.user
+            )
+            return archived.to_booking()
+
     def perform_create(self, serializer):
         # Automatically assign the current user
         serializer.save(user=self.request.user)